@@ -4,10 +4,9 @@
 import os
 import sys
 
-# Let me import jrnl
-# TODO: Is there a better way to do this without making src a package?
-os.chdir(os.path.join(os.getcwd(), "src"))
-sys.path.insert(0, "")
+# Let me import jrnl from the src directory next to this script,
+# without changing directory or searching the current directory first
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
 
 from jrnl.main import main
 
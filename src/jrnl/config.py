@@ -1,7 +1,9 @@
 """Contains functions relating to the config file."""
 
+import functools
 import os
-import yaml
+import stat
+import sys
 from .constants import CONFIG_KEYS
 
 
@@ -17,15 +19,233 @@ class ConfigInvalidException(Exception):
     pass
 
 
+def get_possible_config_paths() -> tuple[str, ...]:
+    """Return the paths to look for config files in, in order.
+
+    $XDG_CONFIG_HOME defaults to ~/.config when it isn't set, in which
+    case it isn't listed twice. TOML config files are looked for ahead
+    of each YAML one, but only on Python 3.11 and later, where tomllib
+    is available.
+
+    Returns:
+        A tuple of strings containing paths to possible config files.
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+    # Pairs of TOML and YAML config paths, in the order to check them
+    config_pairs = [
+        (os.path.expanduser("~/.jrnlrc.toml"), os.path.expanduser("~/.jrnlrc")),
+        (
+            os.path.expanduser("~/.config/jrnl.toml"),
+            os.path.expanduser("~/.config/jrnl.conf"),
+        ),
+        (
+            os.path.join(config_home, "jrnl.toml"),
+            os.path.join(config_home, "jrnl.conf"),
+        ),
+    ]
+
+    if sys.version_info >= (3, 11):
+        possible_configs = [path for pair in config_pairs for path in pair]
+    else:
+        possible_configs = [yaml_path for _, yaml_path in config_pairs]
+
+    # Remove duplicates while preserving order
+    return tuple(dict.fromkeys(possible_configs))
+
+
+# The paths to look for config files in. These don't change while jrnl
+# runs, so only work them out once.
+POSSIBLE_CONFIG_PATHS = get_possible_config_paths()
+
+
+@functools.lru_cache(maxsize=1)
+def get_config_cache_path() -> str:
+    """Return the path of the parsed config cache file.
+
+    This is in $XDG_CACHE_HOME, which defaults to ~/.cache.
+
+    Returns:
+        A string containing the path to the config cache file.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+    return os.path.join(cache_home, "jrnl", "config.json")
+
+
+def read_config_cache(
+    config_path: str, signature: tuple[int, ...]
+) -> dict[str, str | bool | int] | None:
+    """Read a parsed config from the cache, if it's still current.
+
+    Args:
+        config_path: A string containing the path to the config file.
+        signature: A tuple of integers containing the config file's
+            modification time, size, and inode number.
+
+    Returns:
+        A dictionary containing the cached config settings, or None if
+        there's no usable cache for the config file as it is now.
+    """
+    # Only import json when looking at the cache. It's much cheaper to
+    # import than PyYAML, which is the point.
+    import json
+
+    try:
+        with open(get_config_cache_path(), "r") as cache_file:
+            cache = json.load(cache_file)
+
+        if cache["path"] == config_path and cache["signature"] == list(signature):
+            return cache["config"]
+    except (OSError, ValueError, TypeError, KeyError):
+        # No cache, or one we can't use
+        pass
+
+    return None
+
+
+def write_config_cache(
+    config_path: str, signature: tuple[int, ...], config_dict: dict
+) -> None:
+    """Cache a parsed config so later runs can skip parsing it.
+
+    Failing to write the cache isn't an error; the config just gets
+    parsed again next time.
+
+    Args:
+        config_path: A string containing the path to the config file.
+        signature: A tuple of integers containing the config file's
+            modification time, size, and inode number.
+        config_dict: A dictionary containing the parsed config settings.
+    """
+    import json
+
+    try:
+        cache_text = json.dumps(
+            {"path": config_path, "signature": list(signature), "config": config_dict}
+        )
+    except (TypeError, ValueError):
+        # Not representable as JSON
+        return
+
+    # Don't cache anything that wouldn't come back the same, like
+    # non-string keys
+    if json.loads(cache_text)["config"] != config_dict:
+        return
+
+    # Write to a temporary file and move it into place, so other runs
+    # never see a partially written cache
+    cache_path = get_config_cache_path()
+    temp_path = "%s.%d.tmp" % (cache_path, os.getpid())
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+
+        with open(temp_path, "w") as temp_file:
+            temp_file.write(cache_text)
+
+        os.replace(temp_path, cache_path)
+    except OSError:
+        # Clean up after ourselves if we got as far as the temporary
+        # file
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(
+    config_path: str, signature: tuple[int, ...]
+) -> dict[str, str | bool | int]:
+    """Load and validate a config file.
+
+    This is cached in memory on the config file's path and signature,
+    so repeated lookups of an unchanged config file don't parse it
+    again. Parsed configs are also cached on disk, so later runs of
+    jrnl can skip parsing (and importing PyYAML) while the config file
+    is unchanged.
+
+    Config files ending in ".toml" are parsed as TOML; anything else is
+    parsed as YAML.
+
+    Args:
+        config_path: A string containing the path to the config file.
+        signature: A tuple of integers containing the config file's
+            modification time in nanoseconds, size, and inode number.
+            Used to tell whether the config file has changed.
+
+    Returns:
+        A dictionary containing config settings.
+
+    Raises:
+        ConfigInvalidException: The config file is invalid.
+    """
+    # Use the config parsed by an earlier run if it's still current
+    config_dict = read_config_cache(config_path, signature)
+    needs_parsing = config_dict is None
+
+    if needs_parsing and config_path.endswith(".toml"):
+        # TOML configs are parsed with the standard library, which is
+        # much cheaper to import than PyYAML
+        import tomllib
+
+        with open(config_path, "rb") as config_file:
+            try:
+                config_dict = tomllib.load(config_file)
+            except (tomllib.TOMLDecodeError, UnicodeDecodeError):
+                # Bad config file (TOML files have to be UTF-8)
+                raise ConfigInvalidException
+    elif needs_parsing:
+        # Import PyYAML only once we actually have something to parse;
+        # it's slow to import and most of jrnl doesn't need it
+        import yaml
+
+        # Read the config file in one go and hand the bytes to the
+        # loader, rather than letting it read from the file in small
+        # chunks. (PyYAML works out the encoding itself.)
+        with open(config_path, "rb") as config_file:
+            config_bytes = config_file.read()
+
+        # Try loading the config file
+        try:
+            # Use the libyaml-backed loader if PyYAML was built with it,
+            # since it's much faster
+            config_dict = yaml.load(
+                config_bytes,
+                Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+            )
+        except yaml.YAMLError:
+            # Bad config file
+            raise ConfigInvalidException
+
+    # Verify the config is a mapping containing the required options.
+    # Cached configs are checked too, in case the required options have
+    # changed since they were cached.
+    if not (isinstance(config_dict, dict) and CONFIG_KEYS.issubset(config_dict)):
+        raise ConfigInvalidException
+
+    # Save the parse for later runs
+    if needs_parsing:
+        write_config_cache(config_path, signature, config_dict)
+
+    return config_dict
+
+
 def get_config() -> dict[str, str | bool | int]:
     """Find and return config settings dictionary.
 
     Looks for config files located at
 
+    ~/.jrnlrc.toml
     ~/.jrnlrc
+    ~/.config/jrnl.toml
     ~/.config/jrnl.conf
+    $XDG_CONFIG_HOME/jrnl.toml
     $XDG_CONFIG_HOME/jrnl.conf
 
+    where the TOML files are only looked for on Python 3.11 and later.
+
     Returns:
         If a valid config file can be found, returns a dictionary
         containing config settings.
@@ -34,33 +254,19 @@ def get_config() -> dict[str, str | bool | int]:
         ConfigNotFoundException: A config file could not be found.
         ConfigInvalidException: A config file was found to be invalid.
     """
-    # Build list of possible config files
-    possible_configs = [
-        os.path.expanduser("~/.jrnlrc"),
-        os.path.expanduser("~/.config/jrnl.conf"),
-    ]
-
-    # Also look in XDG dirs, provided they exist
-    if config_home := os.environ.get("XDG_CONFIG_HOME"):
-        possible_configs += [config_home + "/jrnl.conf"]
-
     # Iterate through all possible config files
-    for config_path in possible_configs:
-        if os.path.isfile(config_path):
-            with open(config_path, "r") as config_file:
-                # Try loading the config file
-                try:
-                    config_dict = yaml.safe_load(config_file)
-                except yaml.YAMLError:
-                    # Bad config file
-                    raise ConfigInvalidException
-
-                # Verify the config file contains required options
-                if CONFIG_KEYS.issubset(set(config_dict.keys())):
-                    return config_dict
-
-                # Required option(s) not specified
-                raise ConfigInvalidException
+    for config_path in POSSIBLE_CONFIG_PATHS:
+        try:
+            config_stat = os.stat(config_path)
+        except OSError:
+            # Doesn't exist (or we can't see it)
+            continue
+
+        if stat.S_ISREG(config_stat.st_mode):
+            return _load_config(
+                config_path,
+                (config_stat.st_mtime_ns, config_stat.st_size, config_stat.st_ino),
+            )
 
     # None of earlier config files checked out
     raise ConfigNotFoundException
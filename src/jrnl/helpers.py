@@ -2,8 +2,15 @@
 
 from bisect import bisect_left
 import datetime
+import functools
 import os
-import subprocess
+import shutil
+import typing
+
+# Strings accepted as yes and no answers, as in the removed
+# distutils.util.strtobool
+TRUE_STRINGS = frozenset({"y", "yes", "t", "true", "on", "1"})
+FALSE_STRINGS = frozenset({"n", "no", "f", "false", "off", "0"})
 
 
 def find_closest_date(
@@ -35,30 +42,73 @@ def find_closest_date(
     before = date_list[pos - 1]
     after = date_list[pos]
 
-    if after - target_date < target_date - before:
+    # Compare day ordinals rather than subtracting dates, which would
+    # build a timedelta for each side
+    target_ordinal = target_date.toordinal()
+
+    if after.toordinal() - target_ordinal < target_ordinal - before.toordinal():
         return after
 
     return before
 
 
-def get_user_editor() -> str:
-    """Return a string containing user's favourite editor."""
-    # Try finding editor through environment variable lookup
-    editor_name = os.environ.get("EDITOR")
+def file_contains(
+    file_obj: typing.BinaryIO, target: bytes, end: int, chunk_size: int = 65536
+) -> bool:
+    """Find if a binary file contains a byte string.
+
+    The file is read in chunks, so this doesn't need to hold the whole
+    file in memory. Note that this moves the file's position.
+
+    Args:
+        file_obj: A binary file object open for reading.
+        target: A non-empty byte string to search for.
+        end: An integer specifying the offset at which to stop reading
+            the file.
+        chunk_size: An optional integer specifying how many bytes to
+            read at a time.
+
+    Returns:
+        A boolean specifying whether the byte string was found in the
+        part of the file before the end offset.
+    """
+    file_obj.seek(0)
+
+    # Keep enough of the previous chunk around to find matches spanning
+    # two chunks
+    carry_size = len(target) - 1
+    carry = b""
+    remaining = end
+
+    while remaining > 0:
+        chunk = file_obj.read(min(chunk_size, remaining))
 
-    if editor_name:
-        return editor_name
+        if not chunk:
+            break
+
+        if target in carry + chunk:
+            return True
 
-    # Leave it to the user
-    return "editor_name_here"
+        remaining -= len(chunk)
+        carry = (carry + chunk)[-carry_size:] if carry_size else b""
+
+    return False
+
+
+def get_user_editor() -> str:
+    """Return a string containing user's favourite editor."""
+    # Try finding editor through environment variable lookup, otherwise
+    # leave it to the user
+    return os.environ.get("EDITOR") or "editor_name_here"
 
 
+@functools.lru_cache(maxsize=16)
 def is_program_available(program_name: str) -> bool:
     """Find if program passed in is available.
 
-    There's probably a better way to do this that's portable, and in a
-    sense this is not "safe", but for the scope of this program, this
-    approach is fine.
+    This looks up the program on the PATH in-process, rather than
+    spawning a shell to ask it. Results are cached, since the PATH
+    isn't expected to change while jrnl runs.
 
     Args:
         program_name: A string containing a program name.
@@ -66,43 +116,50 @@ def is_program_available(program_name: str) -> bool:
     Returns:
         A boolean specifying whether the program specified is available.
     """
-    return not subprocess.Popen(
-        ["bash", "-c", "type " + program_name],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    ).wait()
+    return shutil.which(program_name) is not None
 
 
-def prompt(query: str) -> bool:
-    """Prompt a yes/no question and get an answer.
+def strtobool(val: str) -> bool:
+    """Convert a string representing truth to a boolean.
 
-    A simple function to ask yes/no questions on the command line.
+    Very similar to the deprecated distutils.util.strtobool.
 
     Args:
-        query: A string containing a question.
+        val: A string to convert.
 
     Returns:
-        A boolean corresponding to the answer to the question asked.
+        A boolean corresponding to the string.
+
+    Raises:
+        ValueError: The string doesn't represent truth or falsehood.
     """
-    print("%s [y/n]: " % query)
-    val = input().lower()
+    val = val.lower()
 
-    def strtobool(s: str) -> bool:
-        """Very similar to deprecated distutils.util.strtobool."""
-        s_low = s.lower()
+    if val in TRUE_STRINGS:
+        return True
+    if val in FALSE_STRINGS:
+        return False
+
+    raise ValueError
 
-        if s_low in ("y", "yes"):
-            return True
-        elif s_low in ("n", "no"):
-            return False
 
-        raise ValueError
+def prompt(query: str) -> bool:
+    """Prompt a yes/no question and get an answer.
 
-    try:
-        result = strtobool(val)
-    except ValueError:
-        # Result no good! Ask again.
-        print("Please answer with y/n")
-        return prompt(query)
+    A simple function to ask yes/no questions on the command line.
 
-    return result
+    Args:
+        query: A string containing a question.
+
+    Returns:
+        A boolean corresponding to the answer to the question asked.
+    """
+    # Keep asking until we get a valid answer
+    while True:
+        print("%s [y/n]: " % query)
+
+        try:
+            return strtobool(input().strip())
+        except ValueError:
+            # Answer no good! Ask again.
+            print("Please answer with y/n")
@@ -1,15 +1,19 @@
 """Contains functions relating to opening journal entries."""
 
+from bisect import bisect_left
 import datetime
-from functools import reduce
-import operator
+import itertools
 import os
-import re
-import subprocess
 import sys
 import typing
-import dateutil.parser
-from .helpers import find_closest_date
+from .helpers import file_contains, find_closest_date
+
+# Date arguments which refer to the latest existing entry
+HEAD_ALIASES = frozenset({"head", "last", "latest"})
+
+# How many bytes from the end of an entry to look at first when writing
+# a timestamp
+TIMESTAMP_TAIL_SIZE = 4096
 
 
 class EntryNotFoundException(Exception):
@@ -42,6 +46,31 @@ class JournalHeadNotFoundException(EntryNotFoundException):
     pass
 
 
+def _is_entry_file_name(name: str) -> bool:
+    """Check whether a file name looks like an entry's (YYYY-MM-DD.txt).
+
+    This only checks the name's structure, with plain string checks
+    rather than a regular expression; whether it's a real date is left
+    to the caller.
+
+    Args:
+        name: A string containing a file name.
+
+    Returns:
+        A boolean signalling whether the name is shaped like an entry
+        file name.
+    """
+    return (
+        len(name) == 14
+        and name.isascii()
+        and name.endswith(".txt")
+        and name[4] == name[7] == "-"
+        and name[:4].isdigit()
+        and name[5:7].isdigit()
+        and name[8:10].isdigit()
+    )
+
+
 def get_existing_year_directories(journal_path: str) -> list[str]:
     """Get year strings for existing years in journal.
 
@@ -55,7 +84,49 @@ def get_existing_year_directories(journal_path: str) -> list[str]:
         A list of strings containing years for which there are year
         directories in the journal's base directory.
     """
-    return sorted([y for y in os.listdir(journal_path) if re.match(r"\d{4}", y)])
+    with os.scandir(journal_path) as dir_entries:
+        return sorted(
+            e.name
+            for e in dir_entries
+            if len(e.name) == 4 and e.name.isdigit() and e.is_dir()
+        )
+
+
+def iter_year_entry_dates(
+    year: str, journal_path: str
+) -> typing.Iterator[datetime.date]:
+    """Yield dates for all existing journal entries within a given year.
+
+    The dates are yielded in no particular order.
+
+    Args:
+        year: An string specifying the year to get entries for.
+        journal_path: A string containing the path to the journal's base
+            directory.
+
+    Yields:
+        datetime.dates corresponsing to dates for which there are
+        existing entries within the specified year.
+    """
+    year_dir_path = os.path.join(journal_path, year)
+
+    with os.scandir(year_dir_path) as dir_entries:
+        for dir_entry in dir_entries:
+            name = dir_entry.name
+
+            # Only look at files named like YYYY-MM-DD.txt. The name
+            # checks are cheap, so do them before asking about file type.
+            if not (_is_entry_file_name(name) and dir_entry.is_file()):
+                continue
+
+            # Build the date straight from the file name, which is much
+            # faster than going through strptime. The fields are known to
+            # be digits, but not that they make a real date.
+            try:
+                yield datetime.date(int(name[:4]), int(name[5:7]), int(name[8:10]))
+            except ValueError:
+                # Not a valid date
+                pass
 
 
 def get_years_existing_entry_dates(year: str, journal_path: str) -> list[datetime.date]:
@@ -72,17 +143,7 @@ def get_years_existing_entry_dates(year: str, journal_path: str) -> list[datetim
         A list of datetime.dates corresponsing to dates for which there
         are existing entries within the specified year.
     """
-    # Get all file names
-    year_dir_path = os.path.join(journal_path, year)
-    file_names = os.listdir(year_dir_path)
-
-    # Filter for valid dates
-    date_strings = [d[:-4] for d in file_names if re.match(r"\d{4}-\d{2}-\d{2}.txt", d)]
-
-    # Build date objects for the dates
-    dates = [datetime.datetime.strptime(d, "%Y-%m-%d").date() for d in date_strings]
-
-    return sorted(dates)
+    return sorted(iter_year_entry_dates(year, journal_path))
 
 
 def get_all_entry_dates(journal_path: str) -> list[datetime.date]:
@@ -98,21 +159,21 @@ def get_all_entry_dates(journal_path: str) -> list[datetime.date]:
         A list of datetime.dates corresponsing to dates for which there
         are existing entries.
     """
-    entries_by_year = [
-        entry
-        for entry in [
+    # Each year's dates are sorted, and the years are too, so chaining
+    # them together keeps everything in order
+    return list(
+        itertools.chain.from_iterable(
             get_years_existing_entry_dates(year, journal_path)
             for year in get_existing_year_directories(journal_path)
-        ]
-    ]
-
-    # See https://stackoverflow.com/a/45323085 for a comparison of
-    # flattening solutions in Python (hint: it's the one I'm using here)
-    return reduce(operator.iconcat, entries_by_year, [])
+        )
+    )
 
 
 def find_entrys_nth_ancestor(
-    date: datetime.date, n: int, journal_path: str
+    date: datetime.date,
+    n: int,
+    journal_path: str,
+    entry_dates: list[datetime.date] | None = None,
 ) -> datetime.date:
     """Find a given entry's nth ancestor.
 
@@ -126,6 +187,9 @@ def find_entrys_nth_ancestor(
         n: An integer specifying the nth ancestor of the passed.
         journal_path: A string containing the path to the journal's base
             directory.
+        entry_dates: An optional list of all existing entry dates, as
+            given by get_all_entry_dates. Pass this in to avoid scanning
+            the journal again.
 
     Returns:
         A datetime.date corresponding to the nth ancestor of the entry
@@ -137,31 +201,35 @@ def find_entrys_nth_ancestor(
         EntryArgumentNotFoundException: The entry corresponding to the
             passed in date doesn't exist.
     """
-    # Get all the existing entry dates. This could be optimized to
-    # include fewer years, but realistically, it's so fast anyway that I
-    # don't care; grabbing all entries greatly simplifies the logic of
-    # this function.
-    year_entries = get_all_entry_dates(journal_path)
-
-    # Get the index of the target entry
-    try:
-        target_index = year_entries.index(date)
-    except ValueError:
+    # Get all the existing entry dates, unless we already have them.
+    # This could be optimized to include fewer years, but realistically,
+    # it's so fast anyway that I don't care; grabbing all entries
+    # greatly simplifies the logic of this function.
+    if entry_dates is None:
+        entry_dates = get_all_entry_dates(journal_path)
+
+    # Get the index of the target entry. The dates are sorted, so binary
+    # search for it rather than scanning the whole list.
+    target_index = bisect_left(entry_dates, date)
+
+    if target_index == len(entry_dates) or entry_dates[target_index] != date:
         # Passed in date doesn't have an entry!
         raise EntryArgumentNotFoundException
 
     # Calculate the ancestor's index and validate
     ancestor_index = target_index - n
 
-    if ancestor_index < 0 or ancestor_index >= len(year_entries):
+    if ancestor_index < 0 or ancestor_index >= len(entry_dates):
         raise EntryAncestorNotFoundException
 
     # Valid. Return the date.
-    return year_entries[ancestor_index]
+    return entry_dates[ancestor_index]
 
 
 def find_closest_existing_entry(
-    date: datetime.date, journal_path: str
+    date: datetime.date,
+    journal_path: str,
+    entry_dates: list[datetime.date] | None = None,
 ) -> datetime.date:
     """Find the closest existing entry given a date.
 
@@ -170,6 +238,9 @@ def find_closest_existing_entry(
             entry date.
         journal_path: A string containing the path to the journal's base
             directory.
+        entry_dates: An optional list of all existing entry dates, as
+            given by get_all_entry_dates. Pass this in to avoid scanning
+            the journal again.
 
     Returns:
         A datetime.date corresponding to the closest existing entry to
@@ -179,13 +250,14 @@ def find_closest_existing_entry(
         EntryNeighbourNotFoundException: No existing entry could be
             found.
     """
-    # Get all the existing entry dates
-    year_entries = get_all_entry_dates(journal_path)
+    # Get all the existing entry dates, unless we already have them
+    if entry_dates is None:
+        entry_dates = get_all_entry_dates(journal_path)
 
-    if not year_entries:
+    if not entry_dates:
         raise EntryNeighbourNotFoundException
 
-    return find_closest_date(year_entries, date)
+    return find_closest_date(entry_dates, date)
 
 
 def find_lastest_existing_entry(journal_path: str) -> datetime.date:
@@ -202,14 +274,14 @@ def find_lastest_existing_entry(journal_path: str) -> datetime.date:
     Raises:
         JournalHeadNotFoundException: The latest entry couldn't be found.
     """
-    # Iterate through existing years until we find an existing entry
-    existing_years = get_existing_year_directories(journal_path)
+    # Iterate through existing years, latest first, until we find an
+    # existing entry. Only the latest date matters, so there's no need
+    # to sort the year's entries.
+    for year in reversed(get_existing_year_directories(journal_path)):
+        latest_date = max(iter_year_entry_dates(year, journal_path), default=None)
 
-    for year in existing_years[::-1]:
-        year_dates = get_years_existing_entry_dates(year, journal_path)
-
-        if year_dates:
-            return year_dates[-1]
+        if latest_date is not None:
+            return latest_date
 
     # No journal head found
     raise JournalHeadNotFoundException
@@ -231,36 +303,102 @@ def parse_ancestor_offsets(date_arg: str) -> tuple[str, int]:
         argument's offsets have said to use the Nth ancestor of the
         passed in date.
     """
-    tilde_pattern = r".*~(-?\d*)$"
-    offset = 0
+    # Deal with caret offsetting. Strip all the trailing carets in one
+    # go; each one is an offset of one.
+    caretless_date_arg = date_arg.rstrip("^")
+
+    if len(caretless_date_arg) < len(date_arg):
+        return (caretless_date_arg, len(date_arg) - len(caretless_date_arg))
+
+    # Deal with tilde offsetting. Only the part after the last tilde can
+    # be an offset, and it needs to be an integer.
+    base_date_arg, tilde, offset_str = date_arg.rpartition("~")
+
+    if tilde and offset_str.removeprefix("-").isdecimal():
+        return (base_date_arg, int(offset_str))
+
+    # No offsets to parse
+    return (date_arg, 0)
+
+
+def parse_date_offset(date_string: str) -> int | None:
+    """Parse a string containing a date offset.
+
+    This accepts exactly what int() does (e.g., "-1", " -1", "+0", and
+    "-1_0").
+
+    Args:
+        date_string: A string containing a date offset to be parsed.
+
+    Returns:
+        An integer containing the date offset, or None if the string
+        isn't an integer.
+    """
+    try:
+        return int(date_string)
+    except ValueError:
+        # Not an integer (or too long a one for int() to convert)
+        return None
+
+
+def parse_date_string(date_string: str) -> datetime.date:
+    """Parse a string containing a date.
 
-    # Deal with caret offsetting
-    saw_caret = False
+    Dates in known formats are parsed with the standard library first,
+    since that's much faster than dateutil. Anything else falls back on
+    dateutil's fuzzy parser.
 
-    while date_arg.endswith("^"):
-        saw_caret = True
+    Args:
+        date_string: A string containing a date to be parsed.
+
+    Returns:
+        A datetime.date corresponding to the date string.
 
-        offset += 1
-        date_arg = date_arg[:-1]
+    Raises:
+        ValueError: The date string couldn't be parsed.
+        OverflowError: The date string contains a number too large to
+            be part of a date.
+    """
+    # Strings without any letters or digits can't contain a date. Don't
+    # bother with the parsers (dateutil is especially slow on these).
+    if not any(c.isalnum() for c in date_string):
+        raise ValueError("%r does not contain a date" % date_string)
 
-    if saw_caret:
-        return (date_arg, offset)
+    # Try ISO 8601 dates (and datetimes) first, since these are by far
+    # the most common
+    try:
+        return datetime.datetime.fromisoformat(date_string).date()
+    except ValueError:
+        pass
 
-    # Deal with tilde offsetting
-    regex_match = re.match(tilde_pattern, date_arg)
+    # Then try compact dates (YYYYMMDD). Python 3.10's fromisoformat
+    # doesn't accept these, so pull the fields out directly.
+    if len(date_string) == 8 and date_string.isdecimal():
+        try:
+            return datetime.date(
+                int(date_string[:4]), int(date_string[4:6]), int(date_string[6:])
+            )
+        except ValueError:
+            pass
 
-    if regex_match and regex_match.group(1):
-        offset_str = regex_match.group(1)
+    # Then try dates with slashes
+    try:
+        return datetime.datetime.strptime(date_string, "%Y/%m/%d").date()
+    except ValueError:
+        pass
 
-        offset += int(offset_str)
-        date_arg = date_arg[: -(len(offset_str) + 1)]
+    # dateutil is slow to import, so only load it when we need to fall
+    # back on its parser
+    import dateutil.parser
 
-    # No offsets left to parse
-    return (date_arg, offset)
+    return dateutil.parser.parse(date_string, fuzzy=True).date()
 
 
 def parse_dates(
-    date_args: str, late_night_date_offset: datetime.timedelta, journal_path: str
+    date_args: list[str],
+    late_night_date_offset: datetime.timedelta,
+    journal_path: str,
+    error_stream: typing.TextIO = sys.stderr,
 ) -> list[datetime.date]:
     """Parse dates given in runtime arguments.
 
@@ -271,6 +409,9 @@ def parse_dates(
             to shift the raw date back a day.
         journal_path: A string containing the path to the journal's base
             directory.
+        error_stream: An optional TextIO object to send error messages
+            to. Almost certainly you want to use the default standard error
+            output.
 
     Returns:
         A list of datetime.dates representing the entry dates to open.
@@ -278,6 +419,19 @@ def parse_dates(
     # Parse dates given in runtime argument
     parsed_dates = []
 
+    # Get the date offsets are relative to once, rather than for every
+    # date argument
+    offset_base_date = datetime.date.today() + late_night_date_offset
+
+    # All existing entry dates, for @ and ancestor lookups. The journal
+    # is only scanned for these the first time one is needed, however
+    # many date arguments use them.
+    entry_dates = None
+
+    # Error messages for bad date arguments. These are collected and
+    # written all at once at the end, rather than one write each.
+    error_messages = []
+
     for date_string in date_args:
         original_date_string = date_string
         parsed_date = None
@@ -295,87 +449,80 @@ def parse_dates(
             do_find_closest_entry = False
 
         # Check for journal head
-        try:
-            assert date_string.lower() in ("head", "last", "latest")
-
-            parsed_date = find_lastest_existing_entry(journal_path)
-        except JournalHeadNotFoundException:
-            # No journal head!
-            print("No existing journal entry found!", file=sys.stderr)
+        if date_string.lower() in HEAD_ALIASES:
+            try:
+                parsed_date = find_lastest_existing_entry(journal_path)
+            except JournalHeadNotFoundException:
+                # No journal head!
+                error_messages.append("No existing journal entry found!\n")
 
-            continue
-        except AssertionError:
-            pass
+                continue
 
-        # Check for negative date offsetting
-        if parsed_date is None:
+        # Check for negative date offsetting. Don't allow date offseting
+        # from the future; check if those arguments are dates instead.
+        elif (
+            date_offset := parse_date_offset(date_string)
+        ) is not None and date_offset <= 0:
+            # Create datetime object using date offset from current day
             try:
-                date_offset = int(date_string)
-
-                if date_offset > 0:
-                    # Don't allow date offseting from the future. Check
-                    # if the argument passed in is a date instead
-                    raise ValueError
-
-                # Create datetime object using date offset from current
-                # day
-                parsed_date = (
-                    datetime.date.today()
-                    + datetime.timedelta(days=date_offset)
-                    + late_night_date_offset
-                )
+                parsed_date = offset_base_date + datetime.timedelta(days=date_offset)
             except OverflowError:
-                print("%s is too large an offset!" % date_offset, file=sys.stderr)
+                error_messages.append("%s is too large an offset!\n" % date_offset)
 
                 continue
-            except ValueError:
-                pass
 
         # Check if the date-string is a proper date
-        if parsed_date is None:
+        else:
             try:
-                parsed_date = dateutil.parser.parse(date_string, fuzzy=True).date()
-            except ValueError:
+                parsed_date = parse_date_string(date_string)
+            except (ValueError, OverflowError):
+                # dateutil raises OverflowError for numbers too large to
+                # be any date part
                 pass
 
         # Complain if the date couldn't be parsed
         if parsed_date is None:
-            print("%s is not a valid date!" % date_string, file=sys.stderr)
+            error_messages.append("%s is not a valid date!\n" % date_string)
 
             continue
 
         # Apply @ matching if it was provided
         if do_find_closest_entry:
+            if entry_dates is None:
+                entry_dates = get_all_entry_dates(journal_path)
+
             try:
-                parsed_date = find_closest_existing_entry(parsed_date, journal_path)
+                parsed_date = find_closest_existing_entry(
+                    parsed_date, journal_path, entry_dates
+                )
             except EntryNeighbourNotFoundException:
                 # No existing journal entries!
-                print("No existing journal entry found!", file=sys.stderr)
+                error_messages.append("No existing journal entry found!\n")
 
         # Apply ancestor offseting if any was given
         if ancestor_offset:
+            if entry_dates is None:
+                entry_dates = get_all_entry_dates(journal_path)
+
             try:
                 parsed_date = find_entrys_nth_ancestor(
-                    parsed_date, ancestor_offset, journal_path
+                    parsed_date, ancestor_offset, journal_path, entry_dates
                 )
             except EntryArgumentNotFoundException:
                 # No entry to base ancestor off of
-                print(
-                    "Base of %s does not correspond to an existing entry!"
-                    % original_date_string,
-                    file=sys.stderr,
+                error_messages.append(
+                    "Base of %s does not correspond to an existing entry!\n"
+                    % original_date_string
                 )
-                print(
-                    "Ancestor lookup needs to be based on an existing entry!",
-                    file=sys.stderr,
+                error_messages.append(
+                    "Ancestor lookup needs to be based on an existing entry!\n"
                 )
 
                 continue
             except EntryAncestorNotFoundException:
                 # Ancestor does not exist
-                print(
-                    "Ancestor %s does not exist!" % original_date_string,
-                    file=sys.stderr,
+                error_messages.append(
+                    "Ancestor %s does not exist!\n" % original_date_string
                 )
 
                 continue
@@ -383,11 +530,13 @@ def parse_dates(
         # All good!
         parsed_dates.append(parsed_date)
 
+    error_stream.writelines(error_messages)
+
     return parsed_dates
 
 
 def write_timestamp(
-    entry_path: str, this_datetime: datetime.datetime = datetime.datetime.today()
+    entry_path: str, this_datetime: datetime.datetime | None = None
 ) -> None:
     """Write timestamp to entry, if one doesn't already exist.
 
@@ -395,8 +544,8 @@ def write_timestamp(
     possibly date in ISO 8601 format. How this works depends on the file
     being created/modified:
 
-    (1) If the entry text file doesn't already exist, create it
-        and write the date and time to the top of the file.
+    (1) If the entry text file doesn't already exist (or is empty),
+        create it and write the date and time to the top of the file.
     (2) If the entry already exists, look inside and see if
         the datetime's date is already written.  If the datetime's date
         is not written, append the date and time to the file, ensuring
@@ -409,58 +558,103 @@ def write_timestamp(
         entry_path: A string containing a path to a entry, already
             created or not.
         this_datetime: An optional datetime.datetime object representing
-            the time to write a timestamp for.
+            the time to write a timestamp for. Defaults to right now.
     """
-    # Get strings for today's date and time
-    this_date = this_datetime.strftime("%Y-%m-%d")
-    this_time = this_datetime.strftime("%H:%M")
-
-    # Check if entry already exists. If so write, the date and time to
-    # it.
-    if not os.path.isfile(entry_path):
-        with open(entry_path, "x") as jrnl_entry:
-            jrnl_entry.write(this_date + "\n" + this_time + "\n")
-    else:
-        # Find if date already written
-        entry_text = open(entry_path).read()
-
-        if this_date in entry_text:
+    # Default to right now. This can't be a default argument, since
+    # those are only evaluated once, when the module is imported.
+    if this_datetime is None:
+        this_datetime = datetime.datetime.now()
+
+    # Get strings for today's date and time. Build these directly,
+    # which is faster than going through strftime.
+    this_date = this_datetime.date().isoformat()
+    this_time = f"{this_datetime.hour:02d}:{this_datetime.minute:02d}"
+
+    # Open the entry for appending, creating it if it doesn't exist,
+    # with a single open call whether the entry is new or not.
+    # Timestamps are plain ASCII, so the entry is used in binary mode to
+    # skip text encoding.
+    entry_fd = os.open(entry_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o666)
+
+    with os.fdopen(entry_fd, "rb+") as jrnl_entry:
+        # Whether the entry is new (or empty) falls out of its size, so
+        # there's no need to check whether it exists first
+        entry_size = os.fstat(entry_fd).st_size
+
+        if not entry_size:
+            jrnl_entry.write(f"{this_date}\n{this_time}\n".encode("ascii"))
+
+            return
+
+        # Only read the end of the entry to start with. That's all we
+        # need to check for a trailing empty line, and it's where the
+        # date will be if it was written recently, so we don't need to
+        # read large entries in full.
+        tail_start = max(0, entry_size - TIMESTAMP_TAIL_SIZE)
+        jrnl_entry.seek(tail_start)
+        entry_tail = jrnl_entry.read()
+
+        # Find if date already written. Look in the tail first, then at
+        # the start of the entry, since entries created today begin with
+        # today's date. Only search the rest of the entry (including any
+        # date cut off at the tail's start) if neither has it.
+        date_bytes = this_date.encode()
+
+        if date_bytes in entry_tail:
             print_date = False
+        elif tail_start:
+            jrnl_entry.seek(0)
+
+            print_date = not (
+                jrnl_entry.read(len(date_bytes)) == date_bytes
+                or file_contains(
+                    jrnl_entry, date_bytes, tail_start + len(date_bytes) - 1
+                )
+            )
         else:
             print_date = True
 
-        # Find if we need to insert a newline at the bottom of the file
-        if entry_text.endswith("\n\n"):
+        # Find if we need to insert a newline at the bottom of the file.
+        # Treat \r\n and \r line endings like \n, as reading the entry
+        # as text would.
+        if (
+            entry_tail[-4:]
+            .replace(b"\r\n", b"\n")
+            .replace(b"\r", b"\n")
+            .endswith(b"\n\n")
+        ):
             print_newline = False
         else:
             print_newline = True
 
-        # Write to the file
-        with open(entry_path, "a") as jrnl_entry:
-            jrnl_entry.write(
-                print_newline * "\n"
-                + (this_date + "\n") * print_date
-                + this_time
-                + "\n\n"
-            )
+        # Write to the end of the file, all at once. The entry was opened
+        # for appending, so this lands at the end wherever we've read to.
+        newline_prefix = "\n" if print_newline else ""
+        date_prefix = this_date + "\n" if print_date else ""
 
+        jrnl_entry.write(
+            f"{newline_prefix}{date_prefix}{this_time}\n\n".encode("ascii")
+        )
 
-def open_entry(
+
+def prepare_entry(
     date: datetime.date,
-    editor: str,
     journal_path: str,
     do_timestamp: bool,
     in_read_mode: bool,
     error_stream: typing.TextIO = sys.stderr,
-) -> None:
-    """Try opening a journal entry.
+    made_directories: set[str] | None = None,
+) -> str | None:
+    """Get a journal entry ready to be opened.
+
+    This makes the entry's year directory and writes a timestamp to the
+    entry, as necessary.
 
     Args:
         date: A datetime.date object containing which day's journal
-            entry to open.
-        editor: A string containing the name of the editor to use.
-        journal_path: A string containing the path to the journal's base
-            directory.
+            entry to prepare.
+        journal_path: A string containing the normalized path (see
+            os.path.normpath) to the journal's base directory.
         do_timestamp: A boolean signalling whether to append a timestamp
             to a entry before opening.
         in_read_mode: A boolean signalling whether to only open existing
@@ -468,23 +662,68 @@ def open_entry(
         error_stream: An optional TextIO object to send error messages
             to. Almost certainly you want to use the default standard error
             output.
+        made_directories: An optional set of strings containing year
+            directories already made while preparing other entries.
+            Directories in it aren't made again, and directories this
+            makes are added to it. Only share a set between entries
+            prepared together, since directories can be removed later.
+
+    Returns:
+        A string containing the path to the entry, or None if the entry
+        shouldn't be opened.
     """
-    # Determine path the entry text file
-    year_dir_path = os.path.join(journal_path, str(date.year))
-    entry_path = os.path.join(year_dir_path, date.strftime("%Y-%m-%d") + ".txt")
+    # Determine path the entry text file. Simple string formatting is
+    # enough here, since the journal path is normalized by the caller.
+    year_dir_path = f"{journal_path}{os.sep}{date.year}"
+    entry_path = f"{year_dir_path}{os.sep}{date.isoformat()}.txt"
 
     # If in read mode, only open existing entries
     if in_read_mode and not os.path.exists(entry_path):
         print("%s does not exist!" % entry_path, file=error_stream)
-        return
+        return None
 
-    # Make the year directory if necessary
-    if not os.path.isdir(year_dir_path):
-        os.makedirs(year_dir_path)
-
-    # Append *right now*'s timestamp to entry if specified
+    # Append *right now*'s timestamp to entry if specified. Opening the
+    # entry fails if its year directory doesn't exist yet, so only make
+    # the directory then, rather than checking for it every time.
     if do_timestamp:
-        write_timestamp(entry_path)
+        try:
+            write_timestamp(entry_path)
+        except FileNotFoundError:
+            os.makedirs(year_dir_path, exist_ok=True)
+            write_timestamp(entry_path)
+    elif not in_read_mode:
+        # Make the year directory if necessary, so the editor can save
+        # the entry. (In read mode the entry, and so its directory,
+        # already exists.)
+        if made_directories is None or year_dir_path not in made_directories:
+            os.makedirs(year_dir_path, exist_ok=True)
+
+            if made_directories is not None:
+                made_directories.add(year_dir_path)
+
+    return entry_path
+
+
+def exec_entries(entry_paths: list[str], editor: str) -> None:
+    """Replace the current process with an editor opening entries.
+
+    This is for when opening the editor is the last thing jrnl does:
+    rather than forking a child and waiting on it, the editor takes
+    over the process (and so its exit status becomes jrnl's). If there
+    are no entries to open this returns normally.
+
+    Args:
+        entry_paths: A list of strings containing paths to the entries
+            to open. Entries listed more than once are only opened once.
+        editor: A string containing the name of the editor to use.
+    """
+    # Nothing to open
+    if not entry_paths:
+        return
+
+    # Anything still buffered would be lost when the process image is
+    # replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
 
-    # Open the date's entry
-    subprocess.Popen([editor, entry_path]).wait()
+    os.execvp(editor, [editor, *dict.fromkeys(entry_paths)])
@@ -11,11 +11,13 @@ from .constants import (
     CREATE_NEW_ENTRIES_WHEN_SPECIFYING_DATES,
     WRITE_TIMESTAMPS_BY_DEFAULT,
 )
-from .grep_wrapper import grep_wrapper
-from .helpers import is_program_available, prompt
-from .journal import open_entry, parse_dates
 from .runtime_args import parse_runtime_arguments
 
+# Date offsets used for the "hours past midnight included in date"
+# setting
+NO_DATE_OFFSET = datetime.timedelta()
+PREVIOUS_DATE_OFFSET = datetime.timedelta(days=-1)
+
 
 def main() -> None:
     """Main program for jrnl."""
@@ -32,23 +34,34 @@ def main() -> None:
         print("Config file invalid!", file=sys.stderr)
         sys.exit(1)
 
-    # Use grep mode if requested
-    try:
-        if runtime_args.subparser_name == "grep":
+    # Grab the journal root path, which is used throughout. Normalize it
+    # once here (e.g., strip any trailing slash) so paths can be built
+    # from it directly.
+    journal_path = os.path.normpath(config_dict[JOURNAL_PATH])
+
+    # Use grep mode if requested. The subcommand attribute only exists
+    # when a subcommand was given.
+    if getattr(runtime_args, "subparser_name", None) == "grep":
+        # Only import what the grep subcommand needs
+        from .grep_wrapper import grep_wrapper
+
+        sys.exit(
             grep_wrapper(
                 runtime_args.pattern,
-                config_dict[JOURNAL_PATH],
+                journal_path,
                 extra_opts=runtime_args.options,
             )
-            sys.exit(0)
-    except AttributeError:
-        # Grep mode not requested
-        pass
+        )
+
+    # Import the journal and helper functions only now that we know
+    # we're opening entries; --version, --setup, and grep don't need them
+    from .helpers import is_program_available, prompt
+    from .journal import exec_entries, parse_dates, prepare_entry
 
     # Make sure journal root directory exists
-    if not os.path.isdir(config_dict[JOURNAL_PATH]):
-        if prompt("Create '" + config_dict[JOURNAL_PATH] + "'?"):
-            os.makedirs(config_dict[JOURNAL_PATH])
+    if not os.path.isdir(journal_path):
+        if prompt("Create '%s'?" % journal_path):
+            os.makedirs(journal_path, exist_ok=True)
         else:
             sys.exit(0)
 
@@ -68,9 +81,9 @@ def main() -> None:
 
     # Respect the "hours past midnight included in date" setting
     if today.hour < config_dict[HOURS_PAST_MIDNIGHT_INCLUDED_IN_DATE]:
-        latenight_date_offset = datetime.timedelta(days=-1)
+        latenight_date_offset = PREVIOUS_DATE_OFFSET
     else:
-        latenight_date_offset = datetime.timedelta()
+        latenight_date_offset = NO_DATE_OFFSET
 
     # Build datetime.date objects for the relevant dates
     if runtime_args.dates:
@@ -78,7 +91,7 @@ def main() -> None:
         dates = parse_dates(
             runtime_args.dates,
             latenight_date_offset,
-            config_dict[JOURNAL_PATH],
+            journal_path,
         )
 
         if not dates:
@@ -100,15 +113,27 @@ def main() -> None:
         and not config_dict[CREATE_NEW_ENTRIES_WHEN_SPECIFYING_DATES]
     )
 
-    # Open journal entries corresponding to the current date
+    # Get journal entries corresponding to the dates ready, then open
+    # them all in one editor, rather than starting it once per entry.
+    # Keep track of the year directories made along the way, so each is
+    # only made once.
+    entry_paths = []
+    made_directories = set()
+
     for date in dates:
-        open_entry(
+        entry_path = prepare_entry(
             date,
-            editor_name,
-            config_dict[JOURNAL_PATH],
+            journal_path,
             write_timestamp,
             read_mode,
+            made_directories=made_directories,
         )
 
-    # Exit
+        if entry_path is not None:
+            entry_paths.append(entry_path)
+
+    # Hand the process over to the editor
+    exec_entries(entry_paths, editor_name)
+
+    # Only reached if there was nothing to open
     sys.exit(0)
@@ -1,9 +1,9 @@
 """Contains functions relating to parsing runtime args."""
 
 import argparse
+import functools
 import os
 import sys
-import yaml
 from .constants import (
     EDITOR,
     JOURNAL_PATH,
@@ -11,39 +11,242 @@ from .constants import (
     CREATE_NEW_ENTRIES_WHEN_SPECIFYING_DATES,
     WRITE_TIMESTAMPS_BY_DEFAULT,
 )
-from .helpers import get_user_editor
 from .version import DESCRIPTION, NAME, VERSION
 
+# The configuration file printed by --setup. The config file is only a
+# handful of scalars, so it's written out directly rather than dumped
+# with PyYAML; keys are in the same (sorted) order yaml.dump would give.
+# Everything but the editor and journal path is fixed, so only those are
+# filled in when printing.
+CONFIG_FILE_TEMPLATE = (
+    "# jrnl config file\n"
+    "# Save this configuration file in any of the following:\n"
+    "# ~/.jrnlrc\t~/.config/jrnl.conf\t$XDG_CONFIG_HOME/jrnl.conf\n"
+    "#\n"
+    f"# '{HOURS_PAST_MIDNIGHT_INCLUDED_IN_DATE}' is the number of\n"
+    "# hours into the next date a date's journal entries should\n"
+    "# cover. Example: say this setting is set to 4. Then if it\n"
+    "# was 03:00 on 2018-03-03, jrnl would open up 2018-03-02's\n"
+    "# journal entries\n"
+    "\n"
+    f"{CREATE_NEW_ENTRIES_WHEN_SPECIFYING_DATES}: false\n"
+    f"{EDITOR}: %(editor)s\n"
+    f"{HOURS_PAST_MIDNIGHT_INCLUDED_IN_DATE}: 4\n"
+    f"{JOURNAL_PATH}: %(journal_path)s\n"
+    f"{WRITE_TIMESTAMPS_BY_DEFAULT}: true\n"
+    "\n"
+)
+
+
+def _yaml_quote(string: str) -> str:
+    """Quote a string as a YAML double-quoted scalar.
+
+    Args:
+        string: A string to quote.
+
+    Returns:
+        A string containing the quoted string, safe to use as a YAML
+        value.
+    """
+    return '"%s"' % string.replace("\\", "\\\\").replace('"', '\\"')
+
+
+# The timestamp options' destinations, and their names as argparse gives
+# them in error messages
+TIMESTAMP_OPTION_NAMES = {
+    "timestamp": "-t/--timestamp",
+    "no_timestamp": "--no-timestamp",
+}
+
+
+class TimestampOptionAction(argparse.Action):
+    """argparse action to set one of the timestamp options.
+
+    This works like a store_true action, except that using both timestamp
+    options exits with a usage error. The error is the one an argparse
+    mutually exclusive group would give: it names the option given
+    second, then the one given first.
+    """
+
+    def __init__(self, option_strings, dest, help=None):
+        super().__init__(option_strings, dest, nargs=0, default=False, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        for other_dest, other_name in TIMESTAMP_OPTION_NAMES.items():
+            if other_dest != self.dest and getattr(namespace, other_dest, False):
+                parser.error(
+                    "argument %s: not allowed with argument %s"
+                    % (TIMESTAMP_OPTION_NAMES[self.dest], other_name)
+                )
+
+        setattr(namespace, self.dest, True)
+
 
 class PrintConfigAction(argparse.Action):
     """argparse action to print configuration file and exit."""
 
     def __call__(self, parser, namespace, values, option_string=None):
-        # Build configuration file
-        confdict = dict()
-        confdict[EDITOR] = get_user_editor()
-        confdict[JOURNAL_PATH] = os.path.expanduser("~/path/to/journal")
-        confdict[HOURS_PAST_MIDNIGHT_INCLUDED_IN_DATE] = 4
-        confdict[CREATE_NEW_ENTRIES_WHEN_SPECIFYING_DATES] = False
-        confdict[WRITE_TIMESTAMPS_BY_DEFAULT] = True
-
-        # Print configuration file
-        print("# jrnl config file")
-        print("# Save this configuration file in any of the following:")
-        print("# ~/.jrnlrc\t~/.config/jrnl.conf\t$XDG_CONFIG_HOME/jrnl.conf")
-        print("#")
-        print("# '" + HOURS_PAST_MIDNIGHT_INCLUDED_IN_DATE + "' is the number of")
-        print("# hours into the next date a date's journal entries should")
-        print("# cover. Example: say this setting is set to 4. Then if it")
-        print("# was 03:00 on 2018-03-03, jrnl would open up 2018-03-02's")
-        print("# journal entries")
-        print()
-        print(yaml.dump(confdict, default_flow_style=False))
+        # The helpers are only needed here, so don't import them (and
+        # what they import) on every run
+        from .helpers import get_user_editor
+
+        # Print configuration file, all in one write
+        sys.stdout.write(
+            CONFIG_FILE_TEMPLATE
+            % {
+                "editor": _yaml_quote(get_user_editor()),
+                "journal_path": _yaml_quote(os.path.expanduser("~/path/to/journal")),
+            }
+        )
 
         # Exit
         sys.exit(0)
 
 
+def add_default_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the arguments used when no subcommand is given.
+
+    Args:
+        parser: An argparse.ArgumentParser to add arguments to.
+    """
+    parser.add_argument(
+        "dates",
+        help=("journal date(s) to open." " Defaults to right now."),
+        nargs="*",
+    )
+    parser.add_argument("-e", "--editor", help="editor to use")
+    parser.add_argument(
+        "--setup",
+        help="print configuration file and exit",
+        nargs=0,
+        action=PrintConfigAction,
+    )
+    parser.add_argument("--version", action="version", version="%(prog)s " + VERSION)
+    # These two are mutually exclusive, but that's checked by their
+    # action rather than with an argparse mutually exclusive group
+    parser.add_argument(
+        "-t",
+        "--timestamp",
+        help="write a timestamp before opening editor",
+        action=TimestampOptionAction,
+    )
+    parser.add_argument(
+        "--no-timestamp",
+        help="don't write a timestamp before opening editor",
+        action=TimestampOptionAction,
+    )
+
+
+def add_grep_subcommand(subparsers: argparse._SubParsersAction) -> None:
+    """Add the grep subcommand.
+
+    Args:
+        subparsers: An argparse._SubParsersAction to add the subcommand
+            to.
+    """
+    grep_parser = subparsers.add_parser(
+        "grep",
+        description=(
+            "%(prog)s - "
+            "print lines from a time span matching a pattern."
+            " Will accept all grep options (which are not "
+            " listed here);"
+            " see 'man grep' for more details."
+        ),
+        help=(
+            "print lines from a time span matching a pattern."
+            " Will accept any grep options."
+        ),
+    )
+    grep_parser.add_argument("pattern", help="search pattern")
+
+
+# Functions to add each subcommand, keyed by subcommand name
+SUBCOMMANDS = {
+    "grep": add_grep_subcommand,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Find which subcommand, if any, is being used.
+
+    Subcommands need to be the first argument.
+
+    Args:
+        argv: A list of strings containing the runtime arguments,
+            excluding the program name.
+
+    Returns:
+        A string containing the name of the subcommand being used, or
+        None if no subcommand is being used.
+    """
+    if argv and argv[0] in SUBCOMMANDS:
+        return argv[0]
+
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def build_parser(subcommand: str | None) -> argparse.ArgumentParser:
+    """Build the argument parser for a subcommand.
+
+    Only the arguments for the given subcommand (or the default
+    arguments, if no subcommand is given) are added to the parser.
+    Parsers are memoised per subcommand, so each is only built once.
+
+    Args:
+        subcommand: A string containing the name of the subcommand
+            being used, or None if no subcommand is being used.
+
+    Returns:
+        An argparse.ArgumentParser ready to parse runtime arguments.
+    """
+    # Instantiate the parser
+    parser = argparse.ArgumentParser(prog=NAME, description="%(prog)s - " + DESCRIPTION)
+
+    if subcommand is None:
+        # Continue as normal
+        add_default_arguments(parser)
+    else:
+        # Give subparser support and add only the subcommand being used
+        SUBCOMMANDS[subcommand](
+            parser.add_subparsers(dest="subparser_name", title="commands")
+        )
+
+    return parser
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse runtime arguments without argparse, if they're simple.
+
+    By far the most common invocations are plain "jrnl" and "jrnl" with
+    a few dates. Neither needs argparse to do anything, so skip building
+    a parser for them.
+
+    Args:
+        argv: A list of strings containing the runtime arguments,
+            excluding the program name.
+
+    Returns:
+        An object of type 'argparse.Namespace' containing the runtime
+        arguments as attributes, the same as argparse would give, or
+        None if the arguments need argparse to parse them.
+    """
+    # Anything option-like (including negative date offsets, which
+    # argparse has its own rules for) or a subcommand goes to argparse
+    if _sniff_subcommand(argv) is not None or any(arg.startswith("-") for arg in argv):
+        return None
+
+    return argparse.Namespace(
+        dates=argv,
+        editor=None,
+        setup=None,
+        timestamp=False,
+        no_timestamp=False,
+        options=[],
+    )
+
+
 def parse_runtime_arguments() -> argparse.Namespace:
     """Parse runtime arguments using argparse.
 
@@ -55,78 +258,33 @@ def parse_runtime_arguments() -> argparse.Namespace:
         arguments as attributes. See argparse documentation for more
         details.
     """
-    # Annoyingly, subparsers and the dates argument don't work nicely
-    # together - order matters. If using grep, add subparser support.
-    give_grep_priority = bool(len(sys.argv) > 1 and sys.argv[1] == "grep")
-
-    # A function to add subparser support
-    def add_subparsers(parser_: argparse.ArgumentParser) -> argparse._SubParsersAction:
-        """Add subparser support for sub-commands.
+    # Print the version straight away if that's all that's asked for,
+    # the same as argparse's version action would
+    if sys.argv[1:] == ["--version"]:
+        sys.stdout.write("%s %s\n" % (NAME, VERSION))
+        sys.exit(0)
 
-        Args:
-            parser_: An argparse.ArgumentParser
+    # Handle the simple cases without argparse
+    namespace = _fast_parse(sys.argv[1:])
 
-        Returns:
-            An argparse._SubParsersAction subparsers . . . thing?
-        """
-        return parser_.add_subparsers(dest="subparser_name", title="commands")
+    if namespace is not None:
+        return namespace
 
-    # Instantiate the parser
-    parser = argparse.ArgumentParser(prog=NAME, description="%(prog)s - " + DESCRIPTION)
+    # Annoyingly, subparsers and the dates argument don't work nicely
+    # together - order matters. If using a subcommand, build a parser
+    # with subparser support.
+    subcommand = _sniff_subcommand(sys.argv[1:])
+    parser = build_parser(subcommand)
 
-    # Give subparser support if using grep
-    if give_grep_priority:
-        subparsers = add_subparsers(parser)
-
-        # Add grep subcommand
-        grep_parser = subparsers.add_parser(
-            "grep",
-            description=(
-                "%(prog)s - "
-                "print lines from a time span matching a pattern."
-                " Will accept all grep options (which are not "
-                " listed here);"
-                " see 'man grep' for more details."
-            ),
-            help=(
-                "print lines from a time span matching a pattern."
-                " Will accept any grep options."
-            ),
-        )
-        grep_parser.add_argument("pattern", help="search pattern")
+    if subcommand is None:
+        # There's nothing to pass options through to, so anything
+        # unrecognized is an error
+        namespace = parser.parse_args()
+        namespace.options = []
     else:
-        # Continue as normal
-        parser.add_argument(
-            "dates",
-            help=("journal date(s) to open." " Defaults to right now."),
-            nargs="*",
-        )
-        parser.add_argument("-e", "--editor", help="editor to use")
-        parser.add_argument(
-            "--setup",
-            help="print configuration file and exit",
-            nargs=0,
-            action=PrintConfigAction,
-        )
-        parser.add_argument(
-            "--version", action="version", version="%(prog)s " + VERSION
-        )
-        timestamp_option = parser.add_mutually_exclusive_group()
-        timestamp_option.add_argument(
-            "-t",
-            "--timestamp",
-            help="write a timestamp before opening editor",
-            action="store_true",
-        )
-        timestamp_option.add_argument(
-            "--no-timestamp",
-            help="don't write a timestamp before opening editor",
-            action="store_true",
-        )
-
-    # This looks needlessly complicated, but it's necessary to pass in
-    # arbitrary options into grep
-    namespace, extras = parser.parse_known_args()
-    namespace.options = extras
+        # This looks needlessly complicated, but it's necessary to pass
+        # in arbitrary options into grep
+        namespace, extras = parser.parse_known_args()
+        namespace.options = extras
 
     return namespace
@@ -0,0 +1,126 @@
+"""Tests for finding and loading config files."""
+
+import sys
+import pytest
+from jrnl import config
+
+YAML_CONFIG_TEXT = (
+    "create_new_entries_when_specifying_dates: false\n"
+    'editor: "vim"\n'
+    "hours_past_midnight_included_in_date: 4\n"
+    'journal_path: "/path/to/journal"\n'
+    "write_timestamps_by_default: true\n"
+)
+
+TOML_CONFIG_TEXT = (
+    "create_new_entries_when_specifying_dates = false\n"
+    'editor = "nano"\n'
+    "hours_past_midnight_included_in_date = 4\n"
+    'journal_path = "/path/to/journal"\n'
+    "write_timestamps_by_default = true\n"
+)
+
+needs_tomllib = pytest.mark.skipif(
+    sys.version_info < (3, 11), reason="TOML configs need Python 3.11"
+)
+
+
+@pytest.fixture
+def home(tmp_path, monkeypatch):
+    """Set up an empty home directory to look for config files in.
+
+    Returns:
+        A pathlib.Path to the home directory. $XDG_CONFIG_HOME is the
+        "xdg" directory inside it.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "xdg"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    (tmp_path / ".config").mkdir()
+    (tmp_path / "xdg").mkdir()
+
+    monkeypatch.setattr(
+        config, "POSSIBLE_CONFIG_PATHS", config.get_possible_config_paths()
+    )
+
+    # Start (and finish) without anything cached in memory
+    config.get_config_cache_path.cache_clear()
+    config._load_config.cache_clear()
+
+    yield tmp_path
+
+    config.get_config_cache_path.cache_clear()
+    config._load_config.cache_clear()
+
+
+@needs_tomllib
+def test_possible_config_paths(home):
+    """TOML config files are looked for ahead of the YAML ones."""
+    assert config.POSSIBLE_CONFIG_PATHS == tuple(
+        str(home / path)
+        for path in (
+            ".jrnlrc.toml",
+            ".jrnlrc",
+            ".config/jrnl.toml",
+            ".config/jrnl.conf",
+            "xdg/jrnl.toml",
+            "xdg/jrnl.conf",
+        )
+    )
+
+
+@needs_tomllib
+@pytest.mark.parametrize("path", [".jrnlrc.toml", ".config/jrnl.toml", "xdg/jrnl.toml"])
+def test_toml_config_found(home, path):
+    """A TOML config file is found and parsed as TOML."""
+    (home / path).write_text(TOML_CONFIG_TEXT)
+
+    config_dict = config.get_config()
+
+    assert config_dict["editor"] == "nano"
+    assert config_dict["hours_past_midnight_included_in_date"] == 4
+    assert config_dict["write_timestamps_by_default"] is True
+
+
+@needs_tomllib
+@pytest.mark.parametrize(
+    "toml_path, yaml_path",
+    [
+        (".jrnlrc.toml", ".jrnlrc"),
+        (".config/jrnl.toml", ".config/jrnl.conf"),
+        ("xdg/jrnl.toml", "xdg/jrnl.conf"),
+    ],
+)
+def test_toml_preferred_over_yaml(home, toml_path, yaml_path):
+    """A TOML config file is used over a YAML one in the same place."""
+    (home / toml_path).write_text(TOML_CONFIG_TEXT)
+    (home / yaml_path).write_text(YAML_CONFIG_TEXT)
+
+    assert config.get_config()["editor"] == "nano"
+
+
+@needs_tomllib
+def test_earlier_yaml_preferred_over_later_toml(home):
+    """A YAML config file is used over a TOML one looked for later."""
+    (home / ".jrnlrc").write_text(YAML_CONFIG_TEXT)
+    (home / "xdg" / "jrnl.toml").write_text(TOML_CONFIG_TEXT)
+
+    assert config.get_config()["editor"] == "vim"
+
+
+@needs_tomllib
+@pytest.mark.parametrize(
+    "config_bytes",
+    [
+        b"editor = \n",
+        TOML_CONFIG_TEXT.replace("nano", "\xe9").encode("latin-1"),
+        b'editor = "nano"\n',
+    ],
+    ids=["syntax error", "not UTF-8", "missing settings"],
+)
+def test_invalid_toml_config(home, config_bytes):
+    """A bad TOML config file (or one missing settings) is invalid."""
+    (home / ".jrnlrc.toml").write_bytes(config_bytes)
+
+    with pytest.raises(config.ConfigInvalidException):
+        config.get_config()
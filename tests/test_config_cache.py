@@ -0,0 +1,168 @@
+"""Tests for the on-disk parsed config cache."""
+
+import json
+import os
+import pytest
+import yaml
+from jrnl import config
+
+CONFIG_TEXT = (
+    "create_new_entries_when_specifying_dates: false\n"
+    'editor: "vim"\n'
+    "hours_past_midnight_included_in_date: 4\n"
+    'journal_path: "/path/to/journal"\n'
+    "write_timestamps_by_default: true\n"
+)
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Set up a config file, and a cache directory to cache it in.
+
+    Returns:
+        A pathlib.Path to the config file, which is the only config file
+        get_config will look at.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    config_path = tmp_path / "jrnl.conf"
+    config_path.write_text(CONFIG_TEXT)
+    monkeypatch.setattr(config, "POSSIBLE_CONFIG_PATHS", (str(config_path),))
+
+    # Start (and finish) without anything cached in memory
+    config.get_config_cache_path.cache_clear()
+    config._load_config.cache_clear()
+
+    yield config_path
+
+    config.get_config_cache_path.cache_clear()
+    config._load_config.cache_clear()
+
+
+def config_signature(config_path):
+    """Return a config file's signature, as get_config works it out."""
+    config_stat = os.stat(config_path)
+
+    return (config_stat.st_mtime_ns, config_stat.st_size, config_stat.st_ino)
+
+
+def forbid_yaml_parsing(monkeypatch):
+    """Make any attempt to parse YAML fail the test."""
+
+    def fail(*args, **kwargs):
+        pytest.fail("config was parsed instead of read from the cache")
+
+    monkeypatch.setattr(yaml, "load", fail)
+
+
+def test_cache_written(config_path):
+    """Parsing a config caches it alongside its path and signature."""
+    config_dict = config.get_config()
+
+    with open(config.get_config_cache_path()) as cache_file:
+        cache = json.load(cache_file)
+
+    assert cache["path"] == str(config_path)
+    assert cache["signature"] == list(config_signature(config_path))
+    assert cache["config"] == config_dict
+
+    # No temporary files are left behind
+    assert os.listdir(os.path.dirname(config.get_config_cache_path())) == [
+        "config.json"
+    ]
+
+
+def test_cache_hit(config_path, monkeypatch):
+    """An unchanged config is read from the cache without parsing it."""
+    config_dict = config.get_config()
+
+    # Forget the in-memory cache, as a new run of jrnl would
+    config._load_config.cache_clear()
+    forbid_yaml_parsing(monkeypatch)
+
+    assert config.get_config() == config_dict
+
+
+def test_cache_invalidated_by_change(config_path):
+    """Changing the config file means it's parsed again."""
+    config.get_config()
+    config._load_config.cache_clear()
+
+    config_path.write_text(CONFIG_TEXT.replace('"vim"', '"nano"'))
+
+    assert config.get_config()["editor"] == "nano"
+
+
+def test_cache_invalidated_by_same_size_change(config_path):
+    """A change that keeps the config's size is still noticed."""
+    config.get_config()
+    config._load_config.cache_clear()
+
+    config_stat = os.stat(config_path)
+    config_path.write_text(CONFIG_TEXT.replace('"vim"', '"vis"'))
+    os.utime(config_path, ns=(config_stat.st_atime_ns, config_stat.st_mtime_ns + 1))
+
+    assert config.get_config()["editor"] == "vis"
+
+
+def test_cache_for_other_config_ignored(config_path, tmp_path, monkeypatch):
+    """A cache of a different config file isn't used."""
+    config.get_config()
+    config._load_config.cache_clear()
+
+    other_config_path = tmp_path / "other.conf"
+    other_config_path.write_text(CONFIG_TEXT.replace('"vim"', '"nano"'))
+    monkeypatch.setattr(config, "POSSIBLE_CONFIG_PATHS", (str(other_config_path),))
+
+    assert config.get_config()["editor"] == "nano"
+
+
+@pytest.mark.parametrize(
+    "cache_text",
+    [
+        "not json {",
+        "[]",
+        '{"path": "x"}',
+        '{"path": null, "signature": 3, "config": {}}',
+    ],
+)
+def test_corrupt_cache(config_path, cache_text):
+    """A corrupt cache is ignored, and replaced with a good one."""
+    cache_path = config.get_config_cache_path()
+    os.makedirs(os.path.dirname(cache_path))
+
+    with open(cache_path, "w") as cache_file:
+        cache_file.write(cache_text)
+
+    config_dict = config.get_config()
+
+    assert config_dict["editor"] == "vim"
+    assert (
+        config.read_config_cache(str(config_path), config_signature(config_path))
+        == config_dict
+    )
+
+
+def test_unreadable_cache(config_path):
+    """A cache that can't be read (or replaced) is ignored."""
+    # A directory in the way of the cache file can't be read as one, or
+    # moved over
+    os.makedirs(config.get_config_cache_path())
+
+    assert config.get_config()["editor"] == "vim"
+
+    # The temporary file was cleaned up
+    assert os.listdir(os.path.dirname(config.get_config_cache_path())) == [
+        "config.json"
+    ]
+
+
+def test_unwritable_cache_directory(config_path, tmp_path, monkeypatch):
+    """Failing to make the cache directory isn't an error."""
+    # A file in the way of the cache directory means it can't be made
+    blocker_path = tmp_path / "blocker"
+    blocker_path.write_text("")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker_path))
+    config.get_config_cache_path.cache_clear()
+
+    assert config.get_config()["editor"] == "vim"
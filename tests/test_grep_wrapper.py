@@ -0,0 +1,113 @@
+"""Tests for the grep wrapper."""
+
+import os
+import pty
+import shutil
+import pytest
+from jrnl import grep_wrapper
+
+# Entry files to search, relative to the journal root
+ENTRIES = {
+    "2019/01/2019-01-02.txt": "2019-01-02\n10:00\n\nate an apple\n",
+    "2020/03/2020-03-05.txt": "2020-03-05\n09:07\n\napple (x) pie\nb side\n",
+    "2020/03/.2020-03-06.txt": "hidden apple\n",
+    "2020/03/ignored.txt": "ignored apple\n",
+    "2020/03/notes.md": "not an entry apple\n",
+}
+
+needs_ripgrep = pytest.mark.skipif(
+    shutil.which("rg") is None, reason="ripgrep isn't installed"
+)
+
+
+@pytest.fixture
+def journal_root(tmp_path):
+    """Set up a journal with some entries to search.
+
+    Returns:
+        A string containing the path to the journal's base directory.
+    """
+    for entry_path, entry_text in ENTRIES.items():
+        entry_path = tmp_path / entry_path
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        entry_path.write_text(entry_text)
+
+    # Ignore files ripgrep would respect by default
+    (tmp_path / ".ignore").write_text("ignored.txt\n")
+    (tmp_path / "2020" / ".gitignore").write_text("*.txt\n")
+
+    return str(tmp_path)
+
+
+def run_grep(pattern, journal_root, use_ripgrep, monkeypatch):
+    """Run the grep wrapper on a terminal, and return what it prints.
+
+    Args:
+        pattern: A string containing the search pattern.
+        journal_root: A string containing the journal root's path.
+        use_ripgrep: A boolean specifying whether ripgrep should be used
+            (if not, grep is).
+        monkeypatch: The test's monkeypatch fixture.
+
+    Returns:
+        A tuple containing the exit status and a sorted list of the
+        lines printed (ripgrep doesn't print them in any fixed order).
+    """
+    monkeypatch.setattr(grep_wrapper, "is_program_available", lambda _: use_ripgrep)
+
+    # Run on a terminal, since that's where ripgrep's defaults differ
+    master_fd, slave_fd = pty.openpty()
+    saved_stdout_fd = os.dup(1)
+
+    try:
+        os.dup2(slave_fd, 1)
+        exit_status = grep_wrapper.grep_wrapper(pattern, journal_root)
+    finally:
+        os.dup2(saved_stdout_fd, 1)
+        os.close(saved_stdout_fd)
+        os.close(slave_fd)
+
+    output = b""
+
+    try:
+        while chunk := os.read(master_fd, 4096):
+            output += chunk
+    except OSError:
+        # Everything's been read once the terminal's been closed
+        pass
+    finally:
+        os.close(master_fd)
+
+    return exit_status, sorted(output.decode().replace("\r\n", "\n").splitlines())
+
+
+@needs_ripgrep
+@pytest.mark.parametrize("pattern", ["apple", "b side", "^a", "nothing"])
+def test_ripgrep_output_matches_grep(journal_root, monkeypatch, pattern):
+    """ripgrep finds the same lines in the same files, printed the same."""
+    grep_result = run_grep(pattern, journal_root, False, monkeypatch)
+    ripgrep_result = run_grep(pattern, journal_root, True, monkeypatch)
+
+    assert ripgrep_result == grep_result
+
+
+@needs_ripgrep
+def test_ripgrep_searches_hidden_and_ignored_files(journal_root, monkeypatch):
+    """ripgrep searches every entry file, but only entry files."""
+    exit_status, lines = run_grep("apple", journal_root, True, monkeypatch)
+
+    assert exit_status == 0
+    assert lines == sorted(
+        "%s:%s" % (os.path.join(journal_root, entry_path), entry_line)
+        for entry_path, entry_text in ENTRIES.items()
+        for entry_line in entry_text.splitlines()
+        if entry_path.endswith(".txt") and "apple" in entry_line
+    )
+
+
+def test_missing_journal_root(tmp_path, capsys):
+    """A journal root that isn't there is an error, not a traceback."""
+    journal_root = str(tmp_path / "missing")
+
+    assert grep_wrapper.grep_wrapper("apple", journal_root) == 2
+    assert capsys.readouterr().err == "%s: No such file or directory\n" % journal_root
@@ -0,0 +1,48 @@
+"""Tests for getting journal entries ready to be opened."""
+
+import datetime
+import os
+from jrnl.journal import prepare_entry
+
+# The dates of two entries in the same year
+FIRST_DATE = datetime.date(2020, 3, 5)
+SECOND_DATE = datetime.date(2020, 3, 6)
+
+
+def test_year_directory_made(tmp_path):
+    """An entry's year directory is made so the editor can save it."""
+    entry_path = prepare_entry(FIRST_DATE, str(tmp_path), False, False)
+
+    assert entry_path == str(tmp_path / "2020" / "2020-03-05.txt")
+    assert os.path.isdir(tmp_path / "2020")
+
+
+def test_year_directory_remade_after_removal(tmp_path):
+    """A year directory removed between runs is made again."""
+    prepare_entry(FIRST_DATE, str(tmp_path), False, False)
+    os.rmdir(tmp_path / "2020")
+
+    prepare_entry(SECOND_DATE, str(tmp_path), False, False)
+
+    assert os.path.isdir(tmp_path / "2020")
+
+
+def test_made_directories_shared(tmp_path, monkeypatch):
+    """Entries prepared together only make their year directory once."""
+    made_directories = set()
+    makedirs_calls = []
+    real_makedirs = os.makedirs
+
+    def makedirs(*args, **kwargs):
+        makedirs_calls.append(args[0])
+        real_makedirs(*args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", makedirs)
+
+    for date in (FIRST_DATE, SECOND_DATE):
+        prepare_entry(
+            date, str(tmp_path), False, False, made_directories=made_directories
+        )
+
+    assert makedirs_calls == [str(tmp_path / "2020")]
+    assert made_directories == {str(tmp_path / "2020")}
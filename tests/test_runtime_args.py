@@ -0,0 +1,59 @@
+"""Tests for parsing runtime arguments."""
+
+import sys
+import pytest
+from jrnl.runtime_args import parse_runtime_arguments
+
+
+def parse(monkeypatch, *args):
+    """Parse runtime arguments as if jrnl was run with them."""
+    monkeypatch.setattr(sys, "argv", ["jrnl", *args])
+
+    return parse_runtime_arguments()
+
+
+@pytest.mark.parametrize(
+    "args, error",
+    [
+        (
+            ["-t", "--no-timestamp"],
+            "argument --no-timestamp: not allowed with argument -t/--timestamp",
+        ),
+        (
+            ["--no-timestamp", "-t"],
+            "argument -t/--timestamp: not allowed with argument --no-timestamp",
+        ),
+        (
+            ["--no-timestamp", "2020-03-05", "--timestamp"],
+            "argument -t/--timestamp: not allowed with argument --no-timestamp",
+        ),
+        (
+            ["--time", "--no-t"],
+            "argument --no-timestamp: not allowed with argument -t/--timestamp",
+        ),
+    ],
+)
+def test_timestamp_options_exclusive(monkeypatch, capsys, args, error):
+    """Both timestamp options can't be used, and the later one is named."""
+    with pytest.raises(SystemExit) as exit_info:
+        parse(monkeypatch, *args)
+
+    assert exit_info.value.code == 2
+    assert capsys.readouterr().err.splitlines()[-1] == "jrnl: error: " + error
+
+
+@pytest.mark.parametrize(
+    "args, timestamp, no_timestamp",
+    [
+        ([], False, False),
+        (["-t"], True, False),
+        (["-t", "-t"], True, False),
+        (["--no-timestamp"], False, True),
+    ],
+)
+def test_timestamp_options(monkeypatch, args, timestamp, no_timestamp):
+    """Each timestamp option can be used on its own."""
+    runtime_args = parse(monkeypatch, "-e", "vim", *args)
+
+    assert runtime_args.timestamp is timestamp
+    assert runtime_args.no_timestamp is no_timestamp
@@ -0,0 +1,124 @@
+"""Tests for writing timestamps to journal entries."""
+
+import datetime
+from jrnl.journal import TIMESTAMP_TAIL_SIZE, write_timestamp
+
+# The time to write timestamps for in these tests
+THIS_DATETIME = datetime.datetime(2020, 3, 5, 9, 7)
+
+
+def test_new_entry(tmp_path):
+    """A new entry gets the date and time at the top."""
+    entry_path = tmp_path / "2020-03-05.txt"
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == b"2020-03-05\n09:07\n"
+
+
+def test_empty_entry(tmp_path):
+    """An existing but empty entry is treated like a new one."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_path.write_bytes(b"")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == b"2020-03-05\n09:07\n"
+
+
+def test_existing_date_header(tmp_path):
+    """Only the time is written if the date is already in the entry."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_path.write_bytes(b"2020-03-05\n08:00\n\nsome text\n\n")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == (b"2020-03-05\n08:00\n\nsome text\n\n09:07\n\n")
+
+
+def test_date_not_written(tmp_path):
+    """The date is written before the time if it isn't in the entry."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_path.write_bytes(b"2020-03-04\n23:00\n\nsome text\n\n")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == (
+        b"2020-03-04\n23:00\n\nsome text\n\n2020-03-05\n09:07\n\n"
+    )
+
+
+def test_no_trailing_newline(tmp_path):
+    """A newline is added first if the entry doesn't end in an empty line."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_path.write_bytes(b"2020-03-05\n08:00\n\nsome text")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == (b"2020-03-05\n08:00\n\nsome text\n09:07\n\n")
+
+
+def test_crlf_trailing_empty_line(tmp_path):
+    """An empty line ending in \\r\\n counts as an empty line."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_path.write_bytes(b"2020-03-05\r\n08:00\r\n\r\n")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == b"2020-03-05\r\n08:00\r\n\r\n09:07\n\n"
+
+
+def test_header_beyond_tail(tmp_path):
+    """A date header before the tail that's read is still found."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_text = b"2020-03-05\n08:00\n\n" + b"x" * (TIMESTAMP_TAIL_SIZE * 2) + b"\n\n"
+    entry_path.write_bytes(entry_text)
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == entry_text + b"09:07\n\n"
+
+
+def test_date_in_middle_beyond_tail(tmp_path):
+    """A date between the start of the entry and its tail is found."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_text = (
+        b"2020-03-04\n23:00\n\n"
+        + b"x" * TIMESTAMP_TAIL_SIZE
+        + b"\n\n2020-03-05\n00:30\n\n"
+        + b"y" * (TIMESTAMP_TAIL_SIZE * 2)
+        + b"\n\n"
+    )
+    entry_path.write_bytes(entry_text)
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == entry_text + b"09:07\n\n"
+
+
+def test_date_absent_from_large_entry(tmp_path):
+    """The date is written if it's nowhere in a large entry."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    entry_text = b"2020-03-04\n23:00\n\n" + b"x" * (TIMESTAMP_TAIL_SIZE * 3) + b"\n\n"
+    entry_path.write_bytes(entry_text)
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == entry_text + b"2020-03-05\n09:07\n\n"
+
+
+def test_date_straddling_tail_start(tmp_path):
+    """A date cut in two by the start of the tail that's read is found."""
+    entry_path = tmp_path / "2020-03-05.txt"
+    date_end = b"\n00:30\n\n" + b"y" * (TIMESTAMP_TAIL_SIZE - 13) + b"\n\n"
+    head = b"2020-03-04\n23:00\n\n" + b"x" * TIMESTAMP_TAIL_SIZE + b"\n\n"
+    entry_text = head + b"2020-03-05" + date_end
+    entry_path.write_bytes(entry_text)
+
+    # The tail starts partway through the date
+    tail_start = len(entry_text) - TIMESTAMP_TAIL_SIZE
+    assert len(head) < tail_start < len(head) + len(b"2020-03-05")
+
+    write_timestamp(str(entry_path), THIS_DATETIME)
+
+    assert entry_path.read_bytes() == entry_text + b"09:07\n\n"